@@ -5,6 +5,8 @@ build_manifest.py  —  Merge-safe file manifest builder
 - Reads metadata/file_manifest.csv (canonical header below)
 - PRESERVES human fields: title, description, keywords, author, license_override
 - REFRESHES computed fields: size_bytes, sha256, rows, cols
+- The sha256 column is always SHA-256 so it can be checked with `sha256sum`
+  and against checksums/SHA256SUMS; do not swap in another digest
 - Writes the updated CSV back (UTF-8, \n newlines)
 - Generates docs/FILE_MANIFEST.md with a readable summary table
 
@@ -16,7 +18,14 @@ from __future__ import annotations
 import argparse
 import csv
 import hashlib
+import io
+import json
+import mmap
+import os
+import ssl
+import stat
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
@@ -26,6 +35,8 @@ from typing import Dict, List, Tuple, Any
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_MANIFEST = REPO_ROOT / "metadata" / "file_manifest.csv"
 DEFAULT_MD = REPO_ROOT / "docs" / "FILE_MANIFEST.md"
+# Sidecar next to the manifest CSV: computed fields keyed by (size, mtime_ns)
+CACHE_NAME = ".manifest_cache.json"
 
 # ---------- Constants ----------
 HEADER = [
@@ -42,177 +53,448 @@ HEADER = [
     "license_override",
 ]
 
+# Manifest held column-wise: HEADER key -> one string per manifest row
+Columns = Dict[str, List[str]]
+
 HUMAN_FIELDS = {"title", "description", "keywords", "author", "license_override"}
 COMPUTED_FIELDS = {"size_bytes", "sha256", "rows", "cols"}
 
+# Files at or above this size are hashed through mmap instead of buffered reads
+MMAP_THRESHOLD = 10 * 1024 * 1024
+# Read buffer for smaller files, allocated once and reused (one per worker process)
+READ_CHUNK = 1024 * 1024
+_READ_BUF = bytearray(READ_CHUNK)
+# Batches handed to each worker process by refresh_columns
+BATCHES_PER_WORKER = 4
+# Below this many bytes to compute, refresh_columns stays serial
+PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+# ProcessPoolExecutor rejects max_workers > 61 on Windows
+WIN32_MAX_WORKERS = 61
+# Slice size for byte-level newline counting over a mapped CSV
+NEWLINE_SCAN_CHUNK = 1024 * 1024
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 # ---------- Helpers ----------
-def sha256_file(p: Path, chunk_size: int = 1024 * 1024) -> str:
-    h = hashlib.sha256()
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
+def _advise_sequential(fd: int) -> None:
+    """Ask the kernel to read the whole file ahead (Linux/POSIX; no-op elsewhere)."""
+    try:
+        # Separate advice values, not bit flags: one call each
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except (AttributeError, OSError):
+        pass
+
+
+def sha256_file(p: Path, size: int | None = None) -> str:
+    """SHA-256 of a file; pass `size` when the caller already has it from stat()."""
+    h = hashlib.new("sha256")
+    _hash_into(p, p.stat().st_size if size is None else size, h)
     return h.hexdigest()
 
 
+def _hash_into(p: Path, size: int, h: Any, scan: _CsvScan | None = None) -> None:
+    """
+    Feed file p into hash h, and into `scan` when given, with as little
+    Python-level work as possible. Large files are mapped and hashed in a
+    single hashlib update, so OpenSSL (SHA-NI/ARMv8 SHA extensions where
+    available) sees the whole buffer in one C call; the scan then walks the
+    same mapping, stopping once it needs a full parse. Smaller ones are read
+    into a reused buffer, with no per-read allocation. Files bigger than one
+    read get a readahead hint first. `size` is the file's st_size.
+    """
+    with p.open("rb", buffering=0) as f:
+        mm = None
+        if size >= MMAP_THRESHOLD:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass  # file shrank/emptied since stat, or mmap unsupported here: read it instead
+        if size > READ_CHUNK:
+            _advise_sequential(f.fileno())
+        if mm is not None:
+            with mm:
+                h.update(mm)
+                if scan is not None:
+                    scan.feed_all(mm)
+            return
+
+        with memoryview(_READ_BUF) as mv:
+            while True:
+                n = f.readinto(_READ_BUF)
+                if not n:
+                    break
+                h.update(mv[:n])  # only the bytes just read, not the whole buffer
+                if scan is not None:
+                    scan.feed(_READ_BUF, n)
+
+
+class _CsvScan:
+    """
+    Byte-level (rows, cols) of a CSV fed as consecutive chunks; run_all.py
+    has the same scan for its summary (keep the two in step). Only sound
+    when no double quote appears (so no quoted newline) and every CR starts
+    a CRLF: csv.reader also ends rows at a lone CR, which a newline count
+    would miss. Once either shows up the scan stops looking (needs_parse)
+    and result() is None.
+    """
+
+    def __init__(self) -> None:
+        self.nl = 0
+        self.quoted = False
+        self.lone_cr = False
+        self.cr_pending = False  # previous chunk ended in CR; pairs only with a leading LF
+        self.header = bytearray()
+        self.header_done = False
+        self.fed = False
+        self.ends_nl = False
+
+    @property
+    def needs_parse(self) -> bool:
+        return self.quoted or self.lone_cr
+
+    def feed(self, buf: Any, n: int) -> None:
+        """Scan buf[:n] (bytes or bytearray)."""
+        if not n or self.needs_parse:
+            return
+        self.fed = True
+        if buf.find(b'"', 0, n) != -1:
+            self.quoted = True
+            return
+        if self.cr_pending and buf[0] != 0x0A:
+            self.lone_cr = True
+            return
+        self.cr_pending = buf[n - 1] == 0x0D
+        # A CR closing this chunk is settled by the next one
+        if buf.count(b"\r", 0, n) - buf.count(b"\r\n", 0, n) - self.cr_pending:
+            self.lone_cr = True
+            return
+        self.nl += buf.count(b"\n", 0, n)
+        self.ends_nl = buf[n - 1] == 0x0A
+        if not self.header_done:
+            first_nl = buf.find(b"\n", 0, n)
+            self.header += buf[: first_nl if first_nl != -1 else n]
+            self.header_done = first_nl != -1
+
+    def feed_all(self, buf: Any) -> None:
+        """Scan a whole buffer or mmap in NEWLINE_SCAN_CHUNK slices."""
+        for i in range(0, len(buf), NEWLINE_SCAN_CHUNK):
+            if self.needs_parse:
+                break
+            chunk = buf[i:i + NEWLINE_SCAN_CHUNK]
+            self.feed(chunk, len(chunk))
+
+    def result(self) -> Tuple[int, int] | None:
+        if not self.fed:
+            return 0, 0
+        if self.needs_parse or self.cr_pending:
+            return None
+        header = self.header.decode("utf-8-sig").rstrip("\r")
+        if not (self.nl or header):
+            return 0, 0  # nothing but a BOM
+        nrows = self.nl + (0 if self.ends_nl else 1)
+        return nrows, len(next(csv.reader([header])))
+
+
 def count_csv_rows_cols(p: Path) -> Tuple[int, int]:
     """
     Count rows and columns for a CSV file.
     - Rows include header row.
-    - Cols = number of columns in header (or max seen if header missing).
+    - Cols = number of columns in the header (first) row, on every path.
+
+    Files without any double quote or lone CR cannot hold a quoted newline
+    or a CR-only row end, so rows are just LF-terminated lines: count them
+    at byte level and parse only the header. Anything else goes through the
+    full csv.reader pass.
     """
-    import csv
+    scan = _CsvScan()
+    with p.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mm = None  # empty (cannot be mapped), or mmap unsupported here
+        if mm is None:
+            for chunk in iter(lambda: f.read(NEWLINE_SCAN_CHUNK), b""):
+                scan.feed(chunk, len(chunk))
+                if scan.needs_parse:
+                    break
+        else:
+            with mm:
+                scan.feed_all(mm)
+    return scan.result() or _parse_rows_cols(p)
 
-    rows = 0
-    cols = 0
-    # Handle optional BOM cleanly
+
+def _parse_rows_cols(p: Path) -> Tuple[int, int]:
+    """count_csv_rows_cols by a full csv.reader pass."""
+    # csv.reader is the reference for quoting (polars, for one, opens a
+    # quoted field at a bare " mid-field); handle optional BOM cleanly
     with p.open("r", encoding="utf-8-sig", newline="") as f:
         reader = csv.reader(f)
-        for i, row in enumerate(reader, start=1):
-            rows += 1
-            cols = max(cols, len(row))
-    return rows, cols
+        header = next(reader, None)
+        if header is None:
+            return 0, 0
+        return 1 + sum(1 for _ in reader), len(header)
 
 
 def human_bytes(n: int) -> str:
     """Human-friendly size."""
-    units = ["B", "KB", "MB", "GB", "TB"]
-    size = float(n)
-    for u in units:
-        if size < 1024 or u == units[-1]:
-            return f"{size:.0f} {u}" if u == "B" else f"{size:.1f} {u}"
-        size /= 1024.0
-    return f"{n} B"
+    # Unit index from the bit length: each unit is 2**10 of the previous one
+    idx = min(len(SIZE_UNITS) - 1, max(0, (n.bit_length() - 1) // 10))
+    if idx == 0:
+        return f"{n} B"
+    return f"{n / (1 << (idx * 10)):.1f} {SIZE_UNITS[idx]}"
 
 
-def read_manifest(manifest_csv: Path) -> List[Dict[str, Any]]:
+def read_manifest(manifest_csv: Path) -> Columns:
     if not manifest_csv.exists():
         sys.exit(f"[ERROR] Manifest not found: {manifest_csv}")
 
-    with manifest_csv.open("r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        cols = [c.strip() for c in reader.fieldnames or []]
-        # Soft-validate header presence
-        missing = [c for c in HEADER if c not in cols]
-        if missing:
-            sys.exit(
-                "[ERROR] Manifest header mismatch.\n"
-                f"Missing in CSV: {missing}\n"
-                f"Expected header exactly:\n{','.join(HEADER)}"
-            )
-        rows = []
-        for r in reader:
-            # Normalize keys; ensure all HEADER keys present
-            norm = {k: (r.get(k, "") or "").strip() for k in HEADER}
-            rows.append(norm)
-        return rows
-
-
-def write_manifest(manifest_csv: Path, rows: List[Dict[str, Any]]) -> None:
+    # One read for the whole file; StringIO (not splitlines) keeps quoted newlines intact
+    data = manifest_csv.read_bytes().decode("utf-8-sig")
+    reader = csv.reader(io.StringIO(data, newline=""))
+    cols = [c.strip() for c in next(reader, [])]
+    # Soft-validate header presence
+    col_set = set(cols)
+    missing = [c for c in HEADER if c not in col_set]
+    if missing:
+        sys.exit(
+            "[ERROR] Manifest header mismatch.\n"
+            f"Missing in CSV: {missing}\n"
+            f"Expected header exactly:\n{','.join(HEADER)}"
+        )
+    table: Columns = {k: [] for k in HEADER}
+    # Column position of each HEADER key, so CSV column order does not matter
+    pos = [(table[k], cols.index(k)) for k in HEADER]
+    for r in reader:
+        if not r:
+            continue  # blank line
+        # Normalize values; every HEADER column gets one entry per row
+        for col, i in pos:
+            col.append(r[i].strip() if i < len(r) else "")
+    return table
+
+
+def write_manifest(manifest_csv: Path, table: Columns) -> None:
     manifest_csv.parent.mkdir(parents=True, exist_ok=True)
-    with manifest_csv.open("w", encoding="utf-8", newline="\n") as f:
-        writer = csv.DictWriter(f, fieldnames=HEADER)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow({k: r.get(k, "") for k in HEADER})
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(HEADER)
+    # Back to row order only here
+    writer.writerows(zip(*(table[k] for k in HEADER)))
+    manifest_csv.write_bytes(buf.getvalue().encode("utf-8"))
 
 
-def build_markdown(md_path: Path, rows: List[Dict[str, Any]]) -> None:
+def build_markdown(md_path: Path, table: Columns) -> None:
     md_path.parent.mkdir(parents=True, exist_ok=True)
 
-    total_size = 0
-    present_rows = []
-    for r in rows:
-        try:
-            b = int(r.get("size_bytes") or 0)
-        except ValueError:
-            b = 0
-        total_size += b
-        present_rows.append(r)
-
     timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
 
-    lines = []
-    lines.append("# File manifest")
-    lines.append("")
-    lines.append(f"_Generated: {timestamp}_")
-    lines.append("")
-    lines.append("| Path | Kind | Size | Rows | Cols | Title | SHA256 (8) |")
-    lines.append("|------|------|------:|-----:|-----:|-------|------------|")
-
-    for r in present_rows:
-        size = r.get("size_bytes") or ""
-        size_h = human_bytes(int(size)) if size.isdigit() else ""
-        sha = (r.get("sha256") or "")[:8]
-        rows_c = r.get("rows") or ""
-        cols_c = r.get("cols") or ""
-        title = r.get("title") or ""
-        lines.append(
-            f"| {r.get('path','')} | {r.get('kind','')} | {size_h} | {rows_c} | {cols_c} | {title} | `{sha}` |"
-        )
+    buf = io.StringIO()
+    buf.write("# File manifest\n\n")
+    buf.write(f"_Generated: {timestamp}_\n\n")
+    buf.write("| Path | Kind | Size | Rows | Cols | Title | SHA256 (8) |\n")
+    buf.write("|------|------|------:|-----:|-----:|-------|------------|\n")
+
+    # Table rows and the size total in one pass, walking the columns in step
+    total_size = 0
+    for path, kind, size, rows_c, cols_c, title, sha in zip(
+        table["path"], table["kind"], table["size_bytes"], table["rows"], table["cols"], table["title"], table["sha256"]
+    ):
+        if size.isdigit():
+            n = int(size)
+            total_size += n
+            size_h = human_bytes(n)
+        else:
+            size_h = ""
+        buf.write(f"| {path} | {kind} | {size_h} | {rows_c} | {cols_c} | {title} | `{sha[:8]}` |\n")
 
-    lines.append("")
-    lines.append(f"**Files:** {len(present_rows)} &nbsp;&nbsp; **Total size:** {human_bytes(total_size)}")
-    lines.append("")
-    lines.append(
+    buf.write("\n")
+    buf.write(f"**Files:** {len(table['path'])} &nbsp;&nbsp; **Total size:** {human_bytes(total_size)}\n\n")
+    buf.write(
         "> Notes: Sizes/rows/cols are derived automatically. Human fields (title/description/keywords/author/license_override) "
-        "are preserved from the CSV and can be edited there."
+        "are preserved from the CSV and can be edited there.\n"
     )
-    lines.append("")
 
-    md_path.write_text("\n".join(lines), encoding="utf-8")
+    md_path.write_text(buf.getvalue(), encoding="utf-8")
 
 
-def refresh_rows(rows: List[Dict[str, Any]], base: Path) -> List[Dict[str, Any]]:
+def _compute_row(p: Path, size: int) -> Tuple[str, str, Any]:
     """
-    For each existing row:
-    - Recalculate computed fields
-    - Preserve human fields
+    Computed fields for one file of `size` bytes as (size_bytes, sha256,
+    (rows, cols)). When a CSV cannot be counted, its exception stands in for
+    (rows, cols): size and digest are still fresh.
     """
-    updated: List[Dict[str, Any]] = []
-
-    for r in rows:
-        rel = r.get("path", "").strip()
-        if not rel:
-            continue
-
-        # Ensure all keys exist
-        for k in HEADER:
-            r.setdefault(k, "")
+    if p.suffix.lower() != ".csv":
+        return str(size), sha256_file(p, size), ("", "")
+    # One read serves both the hash and the byte-level row count where possible
+    h = hashlib.new("sha256")
+    scan = _CsvScan()
+    _hash_into(p, size, h, scan)
+    try:
+        nrows, ncols = scan.result() or _parse_rows_cols(p)
+        shape: Any = (str(nrows), str(ncols))
+    except Exception as e:
+        shape = e
+    return str(size), h.hexdigest(), shape
+
+
+def _compute_many(files: List[Tuple[Path, int]]) -> List[Any]:
+    """
+    _compute_row over a batch of (path, size) in one worker call, so a pool
+    pays one round trip per batch rather than per file. A failure is
+    returned in place of that file's fields instead of aborting the batch.
+    """
+    out: List[Any] = []
+    for p, size in files:
+        try:
+            out.append(_compute_row(p, size))
+        except Exception as e:
+            out.append(e)
+    return out
+
+
+def _cache_entry_ok(entry: Any) -> bool:
+    """A cache entry usable as-is: a dict with every field, of the type write_cache stores."""
+    return (
+        isinstance(entry, dict)
+        and all(isinstance(entry.get(k), int) for k in ("size", "mtime_ns"))
+        and isinstance(entry.get("sha256"), str)
+        and bool(entry["sha256"])
+        and all(isinstance(entry.get(k), str) for k in ("rows", "cols"))
+    )
 
-        p = (base / rel).resolve()
-        exists = p.exists()
 
-        # Start with original row data (so human fields remain)
-        out = {k: r.get(k, "") for k in HEADER}
+def load_cache(cache_json: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Previously computed fields keyed by manifest path; empty if absent or
+    unreadable. Malformed entries are dropped, so those files are recomputed.
+    """
+    try:
+        data = json.loads(cache_json.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {rel: e for rel, e in data.items() if _cache_entry_ok(e)}
+
+
+def write_cache(cache_json: Path, cache: Dict[str, Dict[str, Any]]) -> None:
+    cache_json.parent.mkdir(parents=True, exist_ok=True)
+    cache_json.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def refresh_columns(
+    table: Columns,
+    base: Path,
+    jobs: int = 1,
+    cache: Dict[str, Dict[str, Any]] | None = None,
+) -> None:
+    """
+    In place, for each listed file:
+    - Recalculate computed fields (across `jobs` worker processes when > 1
+      and there are at least PARALLEL_MIN_BYTES to process)
+    - Preserve human fields
+    Rows without a path are dropped.
 
-        # Compute numbers if file exists
-        if exists and p.is_file():
-            try:
-                size = p.stat().st_size
-                out["size_bytes"] = str(size)
-                out["sha256"] = sha256_file(p)
-
-                if p.suffix.lower() == ".csv":
-                    nrows, ncols = count_csv_rows_cols(p)
-                    out["rows"] = str(nrows)
-                    out["cols"] = str(ncols)
-                else:
-                    out["rows"] = ""
-                    out["cols"] = ""
-            except Exception as e:
-                print(f"[WARN] Could not compute for {rel}: {e}", file=sys.stderr)
+    With a `cache` dict, files whose size and mtime_ns match a well-formed
+    cached entry reuse the cached fields instead of being hashed again;
+    malformed entries are ignored. The dict is rewritten in place to hold
+    exactly the files present in this run.
+    """
+    keep = [i for i, rel in enumerate(table["path"]) if rel.strip()]
+    if len(keep) != len(table["path"]):
+        for k in HEADER:
+            col = table[k]
+            table[k] = [col[i] for i in keep]
+
+    paths = table["path"]
+    size_c, sha_c, rows_c, cols_c = (table[k] for k in ("size_bytes", "sha256", "rows", "cols"))
+    pending: List[Tuple[int, str, Path, int]] = []
+    previous = dict(cache or {})
+    stats: Dict[int, os.stat_result] = {}
+
+    for i, rel in enumerate(paths):
+        rel = rel.strip()
+        # Plain join: open()/stat() need no normalized path, and resolve()
+        # would cost extra syscalls per entry
+        p = base / rel
+
+        # One stat both decides presence and gives the size/mtime used below
+        try:
+            st = p.stat()
+        except OSError:
+            st = None
+
+        # Compute numbers if file exists (human columns are never touched)
+        if st is not None and stat.S_ISREG(st.st_mode):
+            stats[i] = st
+            hit = None
+            if cache is not None:
+                hit = previous.get(rel)
+                if not (_cache_entry_ok(hit) and hit["size"] == st.st_size and hit["mtime_ns"] == st.st_mtime_ns):
+                    hit = None
+            if hit is not None:
+                size_c[i] = str(hit["size"])
+                sha_c[i], rows_c[i], cols_c[i] = hit["sha256"], hit["rows"], hit["cols"]
+            else:
+                pending.append((i, rel, p, st.st_size))
         else:
             # Missing file: clear computed fields (preserve human)
-            out["size_bytes"] = ""
-            out["sha256"] = ""
-            out["rows"] = ""
-            out["cols"] = ""
+            size_c[i] = sha_c[i] = rows_c[i] = cols_c[i] = ""
             print(f"[WARN] Missing file listed in manifest: {rel}", file=sys.stderr)
 
-        updated.append(out)
+    failed = set()
 
-    return updated
+    def merge(i: int, rel: str, res: Any) -> None:
+        """Apply one _compute_many result: the fields, or the exception raised instead."""
+        if isinstance(res, Exception):
+            shape = res
+        else:
+            size_c[i], sha_c[i], shape = res
+        if isinstance(shape, Exception):
+            # Kept out of the cache so it is retried; rows/cols keep their old values
+            failed.add(i)
+            print(f"[WARN] Could not compute for {rel}: {shape}", file=sys.stderr)
+        else:
+            rows_c[i], cols_c[i] = shape
+
+    # Worker start-up (spawn on Windows) costs more than hashing a small bundle
+    pending_bytes = sum(size for _, _, _, size in pending)
+    if jobs > 1 and len(pending) > 1 and pending_bytes >= PARALLEL_MIN_BYTES:
+        workers = min(jobs, len(pending))
+        if sys.platform == "win32":
+            workers = min(workers, WIN32_MAX_WORKERS)
+        # A few contiguous batches per worker: balances load, few round trips
+        step = -(-len(pending) // (workers * BATCHES_PER_WORKER))
+        batches = [pending[k:k + step] for k in range(0, len(pending), step)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_compute_many, [(p, size) for _, _, p, size in batch]) for batch in batches]
+            for batch, fut in zip(batches, futures):
+                try:
+                    results = fut.result()
+                except Exception as e:  # worker died: report every file in its batch
+                    results = [e] * len(batch)
+                for (i, rel, _, _), res in zip(batch, results):
+                    merge(i, rel, res)
+    else:
+        results = _compute_many([(p, size) for _, _, p, size in pending])
+        for (i, rel, _, _), res in zip(pending, results):
+            merge(i, rel, res)
+
+    if cache is not None:
+        # Keep only files present now; stat is from before hashing, so a file
+        # edited mid-run no longer matches and is recomputed next time
+        cache.clear()
+        for i, st in stats.items():
+            if i not in failed:
+                cache[paths[i].strip()] = {
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "sha256": sha_c[i],
+                    "rows": rows_c[i],
+                    "cols": cols_c[i],
+                }
 
 
 # ---------- CLI ----------
@@ -238,6 +520,17 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Do not write files; just print a summary",
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for hashing/counting (default: CPU count; 1 = serial; small batches of work always run serially)",
+    )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Recompute every file instead of reusing unchanged results from {CACHE_NAME}",
+    )
     return ap.parse_args()
 
 
@@ -251,23 +544,31 @@ def main() -> int:
     if not out_md.is_absolute():
         out_md = (REPO_ROOT / out_md).resolve()
 
-    rows = read_manifest(manifest_csv)
-    updated = refresh_rows(rows, REPO_ROOT)
+    print(f"[INFO] Hashing with SHA-256 via {ssl.OPENSSL_VERSION}")
+
+    cache_json = manifest_csv.parent / CACHE_NAME
+    cache = None if args.no_cache else load_cache(cache_json)
+
+    table = read_manifest(manifest_csv)
+    refresh_columns(table, REPO_ROOT, jobs=args.jobs, cache=cache)
 
     # Print brief summary
-    ok = sum(1 for r in updated if r.get("size_bytes"))
-    missing = len(updated) - ok
-    print(f"[INFO] Files in manifest: {len(updated)}  |  present: {ok}  |  missing: {missing}")
+    total = len(table["path"])
+    ok = sum(1 for size in table["size_bytes"] if size)
+    missing = total - ok
+    print(f"[INFO] Files in manifest: {total}  |  present: {ok}  |  missing: {missing}")
 
     if args.dry_run:
         print("[INFO] Dry run: not writing CSV/MD.")
         return 0
 
-    write_manifest(manifest_csv, updated)
+    write_manifest(manifest_csv, table)
     print(f"[INFO] Wrote {manifest_csv}")
+    if cache is not None:
+        write_cache(cache_json, cache)
 
     if not args.no_md:
-        build_markdown(out_md, updated)
+        build_markdown(out_md, table)
         print(f"[INFO] Wrote {out_md}")
 
     return 0
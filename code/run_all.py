@@ -18,9 +18,9 @@ Exit codes:
 """
 
 from __future__ import annotations
-import argparse, csv, sys, re
+import argparse, csv, functools, mmap, sys, re
 from pathlib import Path
-from collections import Counter, defaultdict
+from collections import defaultdict
 from datetime import datetime
 
 HERE = Path(__file__).resolve().parent
@@ -29,6 +29,8 @@ DATA = ROOT / "data"
 DICT = ROOT / "dictionaries"
 PROV = ROOT / "provenance"
 
+NEWLINE_SCAN_CHUNK = 1024 * 1024   # slice size for byte-level row counting
+
 # --- make CLI robust to “smart dashes” and Windows-style /flags ---
 BAD_DASHES = "–—−‒‐"  # en dash, em dash, minus, figure dash, hyphen
 def _sanitized_argv():
@@ -45,85 +47,179 @@ def _sanitized_argv():
 
 # ---------- CSV helpers ----------
 
-def read_csv(path: Path) -> list[dict]:
-    """BOM-safe CSV reader that trims header/value whitespace."""
-    rows: list[dict] = []
+def _clean_headers(raw: list[str]) -> list[str]:
+    return [(h or "").replace("\ufeff", "").strip() for h in raw]
+
+def read_csv(path: Path) -> tuple[list[str], list[tuple[str, ...]]]:
+    """BOM-safe CSV reader that trims header/value whitespace.
+
+    Returns (headers, rows); each row is a tuple aligned with headers, padded
+    with "" when short and truncated when long.
+    """
+    rows: list[tuple[str, ...]] = []
     try:
         with path.open("r", encoding="utf-8-sig", newline="") as f:
             reader = csv.reader(f)
             try:
                 raw_headers = next(reader)
             except StopIteration:
-                return []  # empty file
-            headers = [(h or "").replace("\ufeff", "").strip() for h in raw_headers]
+                return [], []  # empty file
+            headers = _clean_headers(raw_headers)
+            n = len(headers)
+            pad = ("",) * n
             for raw in reader:
-                row = {}
-                for i, h in enumerate(headers):
-                    if i < len(raw):
-                        v = raw[i]
-                        row[h] = v.strip() if isinstance(v, str) else v
-                    else:
-                        row[h] = ""
+                row = tuple(v.strip() for v in raw[:n])
+                if len(row) < n:
+                    row += pad[len(row):]
                 rows.append(row)
     except FileNotFoundError:
-        return []
-    return rows
-
-def require_columns(rows: list[dict], required: list[str]) -> list[str]:
+        return [], []
+    return headers, rows
+
+class _CsvScan:
+    """Byte-level row count and header of a CSV fed as consecutive chunks.
+
+    Same scan as build_manifest._CsvScan (keep the two in step). Only sound
+    when no double quote appears (so no quoted newline) and every CR starts
+    a CRLF: csv.reader also ends rows at a lone CR, which a newline count
+    would miss. Once either shows up the scan stops looking (needs_parse)
+    and result() is None.
+    """
+
+    def __init__(self) -> None:
+        self.nl = 0
+        self.quoted = False
+        self.lone_cr = False
+        self.cr_pending = False  # previous chunk ended in CR; pairs only with a leading LF
+        self.header = bytearray()
+        self.header_done = False
+        self.fed = False
+        self.ends_nl = False
+
+    @property
+    def needs_parse(self) -> bool:
+        return self.quoted or self.lone_cr
+
+    def feed(self, buf, n: int) -> None:
+        """Scan buf[:n] (bytes or bytearray)."""
+        if not n or self.needs_parse:
+            return
+        self.fed = True
+        if buf.find(b'"', 0, n) != -1:
+            self.quoted = True
+            return
+        if self.cr_pending and buf[0] != 0x0A:
+            self.lone_cr = True
+            return
+        self.cr_pending = buf[n - 1] == 0x0D
+        # A CR closing this chunk is settled by the next one
+        if buf.count(b"\r", 0, n) - buf.count(b"\r\n", 0, n) - self.cr_pending:
+            self.lone_cr = True
+            return
+        self.nl += buf.count(b"\n", 0, n)
+        self.ends_nl = buf[n - 1] == 0x0A
+        if not self.header_done:
+            first_nl = buf.find(b"\n", 0, n)
+            self.header += buf[: first_nl if first_nl != -1 else n]
+            self.header_done = first_nl != -1
+
+    def feed_all(self, buf) -> None:
+        """Scan a whole buffer or mmap in NEWLINE_SCAN_CHUNK slices."""
+        for i in range(0, len(buf), NEWLINE_SCAN_CHUNK):
+            if self.needs_parse:
+                break
+            chunk = buf[i:i + NEWLINE_SCAN_CHUNK]
+            self.feed(chunk, len(chunk))
+
+    def result(self) -> tuple[int, list[str]] | None:
+        """(rows including the header, raw header fields), or None."""
+        if not self.fed:
+            return 0, []
+        if self.needs_parse or self.cr_pending:
+            return None
+        header = self.header.decode("utf-8-sig").rstrip("\r")
+        if not (self.nl or header):
+            return 0, []  # nothing but a BOM
+        nrows = self.nl + (0 if self.ends_nl else 1)
+        return nrows, next(csv.reader([header]))
+
+def csv_shape(path: Path) -> tuple[int, list[str]]:
+    """Data row count and cleaned header without materializing rows.
+
+    With no double quote in the file no field can span lines, and with every
+    CR part of a CRLF every row ends in LF, so rows are counted as newlines
+    over an mmap; otherwise csv.reader streams the count.
+    """
+    with path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mm = None  # empty file (cannot be mapped), or mmap unsupported here
+        if mm is not None:
+            with mm:
+                scan = _CsvScan()
+                scan.feed_all(mm)
+            shape = scan.result()
+            if shape is not None:
+                nrows, header = shape
+                return max(nrows - 1, 0), _clean_headers(header)
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return 0, []
+        return sum(1 for _ in reader), _clean_headers(header)
+
+def require_columns(headers: list[str], required: list[str]) -> list[str]:
     errors: list[str] = []
-    if not rows:
+    if not headers:
         errors.append("file has no rows (after header) or is empty")
         return errors
-    headers = list(rows[0].keys())
-    miss = [c for c in required if c not in headers]
+    header_set = set(headers)
+    miss = [c for c in required if c not in header_set]
     if miss:
         errors.append(f"missing required columns: {', '.join(miss)}")
     return errors
 
+@functools.lru_cache(maxsize=65536)
 def ok_iso_date(value: str) -> bool:
     """Accepts YYYY, YYYY-MM, YYYY-MM-DD with calendar validation."""
     if not value or not isinstance(value, str):
         return False
-    m = re.fullmatch(r"(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?", value.strip())
-    if not m:
-        return False
-    y = int(m.group(1))
-    if y < 1 or y > 9999:
+    # Fixed layout, so test lengths/positions directly instead of running a regex
+    v = value.strip()
+    n = len(v)
+    y = v[:4]
+    if not y.isdecimal() or int(y) < 1:
         return False
-    mm = m.group(2)
-    dd = m.group(3)
-    try:
-        if dd:
-            datetime(y, int(mm), int(dd))
-        elif mm:
-            datetime(y, int(mm), 1)
-        else:
-            pass
+    if n == 4:
         return True
-    except ValueError:
-        return False
-
-def unique(values: list[str]) -> bool:
-    seen = [v for v in values if v not in ("", None)]
-    return len(set(seen)) == len(seen)
+    if n == 7 and v[4] == "-" and v[5:].isdecimal():
+        return 1 <= int(v[5:]) <= 12
+    if n == 10 and v[4] == "-" and v[7] == "-" and v[5:7].isdecimal() and v[8:].isdecimal():
+        try:
+            datetime(int(y), int(v[5:7]), int(v[8:]))
+            return True
+        except ValueError:
+            return False
+    return False
 
-def load_provenance_ids() -> set[str]:
+def load_provenance_ids() -> frozenset[str]:
     """Collect source_id keys from provenance/sources.csv or sources.xlsx (optional)."""
     ids: set[str] = set()
     csv_path = PROV / "sources.csv"
     xlsx_path = PROV / "sources.xlsx"
 
     def add_csv(p: Path):
-        rows = read_csv(p)
-        if not rows:
-            return
-        header_keys = rows[0].keys()
-        key = "source_id" if "source_id" in header_keys else ("id" if "id" in header_keys else None)
-        if key:
-            for r in rows:
-                v = (r.get(key) or "").strip()
-                if v:
-                    ids.add(v)
+        # Stream the one column we need instead of building a dict per row
+        with p.open("r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.reader(f)
+            header = _clean_headers(next(reader, []))
+            key = "source_id" if "source_id" in header else ("id" if "id" in header else None)
+            if key is None:
+                return
+            idx = header.index(key)
+            ids.update(v for v in (row[idx].strip() for row in reader if idx < len(row)) if v)
 
     if csv_path.exists():
         add_csv(csv_path)
@@ -145,18 +241,7 @@ def load_provenance_ids() -> set[str]:
                         ids.add(str(v).strip())
         except Exception:
             pass
-    return ids
-
-def warn_unknown_values(rows: list[dict], col: str, allowed: set[str]) -> list[str]:
-    warnings = []
-    seen = set()
-    for r in rows:
-        v = (r.get(col) or "").strip()
-        if v and v not in allowed:
-            seen.add(v)
-    if seen:
-        warnings.append(f"{col}: found {len(seen)} value(s) not in recommended set: {sorted(seen)}")
-    return warnings
+    return frozenset(ids)
 
 # ---------- Schemas ----------
 
@@ -203,9 +288,67 @@ SCHEMAS: dict[str, dict] = {
     },
 }
 
+# Compile each id pattern once rather than per row
+for _schema in SCHEMAS.values():
+    if "id_regex" in _schema:
+        _schema["id_pattern"] = re.compile(_schema["id_regex"])
+
 # ---------- Validators ----------
 
-def validate_file(name: str, strict: bool, prov_ids: set[str]) -> tuple[list[str], list[str]]:
+def _more(items) -> str:
+    return "..." if len(items) > 10 else ""
+
+def make_validator(checks: tuple[tuple[int | None, str], ...]):
+    """Compile a row pass specialized to one schema's (column index, kind) checks.
+
+    The generated function inlines each column index and drops the per-cell
+    kind dispatch; it returns (distinct values per check, duplicated values
+    per check, trailing-whitespace cells), in the order of `checks`. An index of
+    None (column absent from the file) never yields a value.
+    """
+    src = ["def row_pass(headers, rows):"]
+    for j in range(len(checks)):
+        src.append(f"    v{j} = set(); add{j} = v{j}.add; d{j} = set()")
+    src += [
+        "    trailing = []",
+        "    for i, r in enumerate(rows, start=2):",
+    ]
+    for j, (idx, kind) in enumerate(checks):
+        if idx is None:
+            continue
+        # read_csv already stripped every cell
+        src += [
+            f"        x = r[{idx}]",
+            "        if x:",
+        ]
+        if kind in ("id", "unique"):
+            # The distinct-value set doubles as "seen": a repeat is a duplicate
+            src += [
+                f"            if x in v{j}:",
+                f"                d{j}.add(x)",
+                "            else:",
+                f"                add{j}(x)",
+            ]
+        else:
+            src.append(f"            add{j}(x)")
+    src += [
+        "        if len(trailing) < 10:",  # CSV hygiene (warnings)
+        "            for k, v in zip(headers, r):",
+        "                if v != v.strip():",
+        "                    trailing.append((i, k))",
+        "                    if len(trailing) >= 10:",
+        "                        break",
+        "    return ["
+        + ", ".join(f"v{j}" for j in range(len(checks)))
+        + "], ["
+        + ", ".join(f"d{j}" for j in range(len(checks)))
+        + "], trailing",
+    ]
+    ns: dict = {}
+    exec(compile("\n".join(src) + "\n", "<validator>", "exec"), {}, ns)
+    return ns["row_pass"]
+
+def validate_file(name: str, strict: bool, prov_ids: frozenset[str]) -> tuple[list[str], list[str]]:
     path = DATA / name
     errors: list[str] = []
     warnings: list[str] = []
@@ -213,77 +356,82 @@ def validate_file(name: str, strict: bool, prov_ids: set[str]) -> tuple[list[str
     if not path.exists():
         return [f"missing file: {path}"], warnings
 
-    rows = read_csv(path)
+    headers, rows = read_csv(path)
     if not rows:
         return ["file has no rows (or is empty)"], warnings
 
     schema = SCHEMAS[name]
 
-    errors += require_columns(rows, schema["required"])
+    errors += require_columns(headers, schema["required"])
     if errors:
         return errors, warnings
 
-    headers = rows[0].keys()
-    if "" in headers:
+    header_set = set(headers)
+    # Column -> tuple index (last one wins for a repeated name, as dict rows did)
+    col_idx = {h: i for i, h in enumerate(headers)}
+    if "" in header_set:
         errors.append("blank column name in header")
 
-    # Optional: id column & uniqueness
+    # Check descriptors (column, kind, argument), in report order
+    checks: list[tuple[str, str, object]] = []
     id_col = schema.get("id_col")
-    id_re = schema.get("id_regex")
-    if id_col and id_col in headers:
-        ids = [(r.get(id_col) or "").strip() for r in rows]
-        bad = [v for v in ids if v and (not re.fullmatch(id_re, v))]
-        if bad:
-            errors.append(f"{id_col} format violations (expected {id_re}): {sorted(set(bad))[:10]}{'...' if len(set(bad))>10 else ''}")
-        if not unique(ids):
-            dupes = [k for k, c in Counter([v for v in ids if v]).items() if c > 1]
-            errors.append(f"{id_col} duplicate values: {sorted(dupes)[:10]}{'...' if len(dupes)>10 else ''}")
-
-    # Enums (hard errors)
+    if id_col and id_col in header_set:
+        checks.append((id_col, "id", schema["id_pattern"]))                    # format + duplicates
     for col, allowed in schema.get("enums", {}).items():
-        if col in headers:
-            invalid = sorted({(r.get(col) or "").strip() for r in rows if r.get(col) and (r.get(col).strip() not in allowed)})
-            if invalid:
-                errors.append(f"{col}: {len(invalid)} value(s) not in {sorted(allowed)} — {invalid[:10]}{'...' if len(invalid)>10 else ''}")
-
-    # Date validation
-    date_col = schema.get("date_col")
-    if date_col:
-        bad_dates = sorted({(r.get(date_col) or "").strip() for r in rows if r.get(date_col) and not ok_iso_date(r.get(date_col))})
-        if bad_dates:
-            errors.append(f"{date_col}: invalid ISO date(s) (YYYY[-MM[-DD]]): {bad_dates[:10]}{'...' if len(bad_dates)>10 else ''}")
-
-    # Recommended values (warnings)
+        if col in header_set:
+            checks.append((col, "enum", allowed))                                # hard errors
+    if schema.get("date_col"):
+        checks.append((schema["date_col"], "date", None))
     if name == "abbreviations.csv":
-        if "scope" in headers:
-            warnings += warn_unknown_values(rows, "scope", SCHEMAS[name]["recommended_scopes"])
-        ucol = SCHEMAS[name].get("unique_col")
-        if ucol and ucol in headers:
-            terms = [ (r.get(ucol) or "").strip() for r in rows if (r.get(ucol) or "").strip() ]
-            dupes = [k for k, c in Counter(terms).items() if c > 1]
-            if dupes:
-                warnings.append(f"{ucol}: duplicate values: {sorted(dupes)[:10]}{'...' if len(dupes)>10 else ''}")
-
+        if "scope" in header_set:
+            checks.append(("scope", "recommended", schema["recommended_scopes"]))  # warnings
+        ucol = schema.get("unique_col")
+        if ucol and ucol in header_set:
+            checks.append((ucol, "unique", None))                                # duplicate warnings
     # Cross-file: provenance source_id presence
-    if name in ("appendix_c_indicators.csv", "appendix_e_timelines.csv") and prov_ids:
-        col = "source_id"
-        if col in headers:
-            missing = sorted({(r.get(col) or "").strip() for r in rows
-                              if (r.get(col) or "").strip() and (r.get(col).strip() not in prov_ids)})
-            if missing:
-                msg = f"{col}: {len(missing)} value(s) not found in provenance sources: {missing[:10]}{'...' if len(missing)>10 else ''}"
+    if name in ("appendix_c_indicators.csv", "appendix_e_timelines.csv") and prov_ids and "source_id" in header_set:
+        checks.append(("source_id", "provenance", prov_ids))
+
+    # One pass over the rows gathers each checked column's distinct values;
+    # the checks then run per column on those sets rather than per cell
+    key = tuple((col_idx.get(col), kind) for col, kind, _ in checks)
+    row_pass = schema.setdefault("_fn", {}).get(key)
+    if row_pass is None:
+        row_pass = schema["_fn"][key] = make_validator(key)
+    values, duplicates, trailing = row_pass(headers, rows)
+
+    for j, (col, kind, arg) in enumerate(checks):
+        if kind == "id":
+            found = sorted(v for v in values[j] if not arg.fullmatch(v))
+        elif kind == "date":
+            found = sorted(v for v in values[j] if not ok_iso_date(v))
+        elif kind == "unique":
+            found = []
+        else:  # enum / recommended / provenance: set difference
+            found = sorted(values[j] - arg)
+        dupes = sorted(duplicates[j])
+        if kind == "id":
+            if found:
+                errors.append(f"{col} format violations (expected {arg.pattern}): {found[:10]}{_more(found)}")
+            if dupes:
+                errors.append(f"{col} duplicate values: {dupes[:10]}{_more(dupes)}")
+        elif kind == "enum":
+            if found:
+                errors.append(f"{col}: {len(found)} value(s) not in {sorted(arg)} — {found[:10]}{_more(found)}")
+        elif kind == "date":
+            if found:
+                errors.append(f"{col}: invalid ISO date(s) (YYYY[-MM[-DD]]): {found[:10]}{_more(found)}")
+        elif kind == "recommended":
+            if found:
+                warnings.append(f"{col}: found {len(found)} value(s) not in recommended set: {found}")
+        elif kind == "unique":
+            if dupes:
+                warnings.append(f"{col}: duplicate values: {dupes[:10]}{_more(dupes)}")
+        elif kind == "provenance":
+            if found:
+                msg = f"{col}: {len(found)} value(s) not found in provenance sources: {found[:10]}{_more(found)}"
                 (errors if strict else warnings).append(msg)
 
-    # CSV hygiene (warnings)
-    trailing = []
-    for i, r in enumerate(rows, start=2):
-        for k, v in r.items():
-            if isinstance(v, str) and v != v.strip():
-                trailing.append((i, k))
-                if len(trailing) >= 10:
-                    break
-        if len(trailing) >= 10:
-            break
     if trailing:
         warnings.append(f"trailing whitespace in {len(trailing)} cell(s) (first 10 shown): {trailing}")
 
@@ -327,12 +475,12 @@ def summary():
         if not p.exists():
             print(f"{name:35} MISSING")
             continue
-        rows = read_csv(p)
-        if not rows:
+        nrows, cols = csv_shape(p)
+        if not nrows:
             print(f"{name:35}    0 rows | (empty)")
             continue
-        cols = list(rows[0].keys())
-        print(f"{name:35} {len(rows):6d} rows | {len(cols):2d} cols | {', '.join(cols)}")
+        cols = list(dict.fromkeys(cols))  # a repeated header name is listed once
+        print(f"{name:35} {nrows:6d} rows | {len(cols):2d} cols | {', '.join(cols)}")
 
 def main():
     ap = argparse.ArgumentParser(description="Replication bundle utilities (CSV-first).")
@@ -13,7 +13,7 @@ Write-Host "Repo root: $repo" -ForegroundColor Cyan
 if (-not $SkipManifest) {
     Write-Host "Rebuilding file manifest..." -ForegroundColor Yellow
     $LASTEXITCODE = 0
-    & python .\code\build_manifest.py
+    & python .\code\build_manifest.py --no-cache
     if ($LASTEXITCODE -ne 0) {
         Write-Error "Manifest build failed. Aborting."
         exit 1
@@ -61,6 +61,8 @@ if ([string]::IsNullOrWhiteSpace($ZipName)) {
     }
 }
 if (Test-Path $zipPath) { Remove-Item $zipPath -Force }
+# build_manifest.py's local cache is not part of the release
+Remove-Item .\metadata\.manifest_cache.json -Force -ErrorAction SilentlyContinue
 Write-Host "Creating zip: $zipPath" -ForegroundColor Yellow
 Compress-Archive -Path * -DestinationPath $zipPath -Force
 